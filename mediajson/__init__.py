@@ -20,15 +20,19 @@ default and if you require the immutable types then import from immutable instea
 To make use of it either use the dumps, loads, dump, and load functions in
 place of the versions from the standard json module, or use the classes
 NMOSJSONEncoder and NMOSJSONDecoder as your encoder and decoder classes.
+
+To check that a document is well-formed without decoding it use validate.
 """
 
 from json import JSONEncoder, JSONDecoder
 
 from .encode import dump, dumps, encode_value, NMOSJSONEncoder
 from .decode import load, loads, decode_value, NMOSJSONDecoder
+from .validate import validate, ValidationIssue
 
 
 __all__ = ["dump", "dumps", "load", "loads",
            "encode_value", "decode_value",
            "JSONEncoder", "JSONDecoder",
-           "NMOSJSONEncoder", "NMOSJSONDecoder"]
+           "NMOSJSONEncoder", "NMOSJSONDecoder",
+           "validate", "ValidationIssue"]
@@ -23,11 +23,11 @@ your decoder class.
 
 import uuid
 import json
-from json import JSONDecoder
+from json import JSONDecoder, JSONDecodeError
 from fractions import Fraction
 import re
 
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 from .typing import MediaJSONSerialisable, JSONSerialisable
 
 from mediatimestamp.immutable import Timestamp, TimeRange
@@ -40,6 +40,38 @@ __all__ = ["load", "loads",
 
 
 UUID_REGEX = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+TIMESTAMP_REGEX = re.compile(r'^-?\d+:\d+$')
+TIMERANGE_REGEX = re.compile(r'^(\(|\[)?(-?\d+:\d+)?_(-?\d+:\d+)?(\)|\])?$')
+
+# Number of entries each NMOSJSONDecoder keeps in its string and key caches before they are flushed
+DEFAULT_CACHE_SIZE = 1024
+
+# Strings longer than this are never cached, since they are unlikely to be repeated between messages
+_MAX_CACHED_STRING_LENGTH = 64
+
+
+def _as_str(s: Any) -> str:
+    """Convert a str, bytes, bytearray or other buffer-protocol object (eg. a memoryview) to a str.
+
+    Contiguous buffers are decoded directly, without first being copied into an intermediate bytes object.
+    """
+    if isinstance(s, str):
+        return s
+    elif isinstance(s, (bytes, bytearray)):
+        return s.decode(json.detect_encoding(s), 'surrogatepass')
+
+    try:
+        view = memoryview(s)
+    except TypeError:
+        raise TypeError('the JSON object must be str, bytes, bytearray or memoryview, '
+                        f'not {s.__class__.__name__}') from None
+    if not view.c_contiguous:
+        # Only contiguous buffers can be decoded in place, so anything else has to be copied
+        data = view.tobytes()
+        return data.decode(json.detect_encoding(data), 'surrogatepass')
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return str(view, json.detect_encoding(view[:4].tobytes()), 'surrogatepass')
 
 
 def load(*args, **kwargs) -> MediaJSONSerialisable:
@@ -52,7 +84,18 @@ def load(*args, **kwargs) -> MediaJSONSerialisable:
 
 
 def loads(*args, **kwargs) -> MediaJSONSerialisable:
+    """Decode a document held in a str, bytes, bytearray or memoryview.
+
+    When called without any extra arguments a shared NMOSJSONDecoder is used, so that its caches are reused between
+    calls.
+    """
     _args = list(args)
+    if len(_args) > 0:
+        _args[0] = _as_str(_args[0])
+        if len(_args) == 1 and not kwargs:
+            if _args[0].startswith('\ufeff'):
+                raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)", _args[0], 0)
+            return _default_decoder.decode(_args[0])
     if 'cls' not in kwargs and len(args) < 3:
         kwargs['cls'] = NMOSJSONDecoder
     elif len(args) >= 3 and args[2] is None:
@@ -60,12 +103,14 @@ def loads(*args, **kwargs) -> MediaJSONSerialisable:
     return json.loads(*_args, **kwargs)
 
 
+def _is_fraction(o: dict) -> bool:
+    return "numerator" in o and (len(o) == 1 or (len(o) == 2 and "denominator" in o))
+
+
 def decode_value(o: JSONSerialisable) -> MediaJSONSerialisable:
     if isinstance(o, dict):
-        if len(o.keys()) == 2 and "numerator" in o and "denominator" in o:
-            return Fraction(o['numerator'], o['denominator'])
-        elif len(o.keys()) == 1 and "numerator" in o:
-            return Fraction(o['numerator'], 1)
+        if _is_fraction(o):
+            return Fraction(o['numerator'], o.get('denominator', 1))
         else:
             res = {}
             for key in o:
@@ -77,9 +122,9 @@ def decode_value(o: JSONSerialisable) -> MediaJSONSerialisable:
         if re.match(UUID_REGEX,
                     o):
             return uuid.UUID(o)
-        elif re.match(r'^-?\d+:\d+$', o):
+        elif re.match(TIMESTAMP_REGEX, o):
             return Timestamp.from_sec_nsec(o)
-        elif re.match(r'^(\(|\[)?(-?\d+:\d+)?_(-?\d+:\d+)?(\)|\])?$', o):
+        elif re.match(TIMERANGE_REGEX, o):
             return TimeRange.from_str(o)
         elif o == "()":
             return TimeRange.never()
@@ -87,7 +132,18 @@ def decode_value(o: JSONSerialisable) -> MediaJSONSerialisable:
 
 
 class NMOSJSONDecoder(JSONDecoder):
-    def __init__(self, **kwargs):
+    """A JSONDecoder which also decodes timestamps, timeranges, uuids, and fractions.
+
+    Each instance keeps a cache of decoded short strings and a table of interned object keys, which are reused between
+    calls so that repeatedly decoding similar messages allocates less and the results share their keys and immutable
+    values. Each cache holds at most cache_size entries, and a cache_size of 0 disables them both.
+
+    The lists produced by the json parser are decoded in place. When an object_hook or object_pairs_hook is given the
+    parsed structure may contain objects the hook still refers to, so it is copied by decode_value instead.
+
+    Unlike JSONDecoder the decode and raw_decode methods also accept bytes, bytearray and memoryview objects.
+    """
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE, **kwargs):
         # Filter out the 'encoding' parameter as a simple workaround for simplejson adding it.
         # The parameter is no longer supported in python 3.
         py3_kwargs = {
@@ -97,9 +153,67 @@ class NMOSJSONDecoder(JSONDecoder):
         }
         super().__init__(**py3_kwargs)
 
-    def raw_decode(self, s: str, *args, **kwargs) -> Tuple[MediaJSONSerialisable, int]:
+        self._cache_size = cache_size
+        self._string_cache: Optional[Dict[str, MediaJSONSerialisable]] = {} if cache_size > 0 else None
+        self._key_cache: Optional[Dict[str, str]] = {} if cache_size > 0 else None
+
+    def decode(self, s: Any, *args, **kwargs) -> MediaJSONSerialisable:
+        return super(NMOSJSONDecoder, self).decode(_as_str(s), *args, **kwargs)
+
+    def raw_decode(self, s: Any, *args, **kwargs) -> Tuple[MediaJSONSerialisable, int]:
         value: JSONSerialisable
-        (value, offset) = super(NMOSJSONDecoder, self).raw_decode(s,
+        (value, offset) = super(NMOSJSONDecoder, self).raw_decode(_as_str(s),
                                                                   *args,
                                                                   **kwargs)
-        return (decode_value(value), offset)
+        if self.object_hook is not None or self.object_pairs_hook is not None:
+            return (decode_value(value), offset)
+        return (self._decode_parsed(value), offset)
+
+    def _decode_parsed(self, o: Any) -> MediaJSONSerialisable:
+        # Equivalent to decode_value, but updates the freshly parsed structure in place where it can and makes use of
+        # the caches
+        if isinstance(o, dict):
+            if _is_fraction(o):
+                return decode_value(o)
+
+            keys = self._key_cache
+            if keys is None:
+                for (key, value) in o.items():
+                    o[key] = self._decode_parsed(value)
+                return o
+
+            res = {}
+            for (key, value) in o.items():
+                if len(key) <= _MAX_CACHED_STRING_LENGTH:
+                    interned = keys.get(key)
+                    if interned is not None:
+                        key = interned
+                    else:
+                        if len(keys) >= self._cache_size:
+                            keys.clear()
+                        keys[key] = key
+                res[key] = self._decode_parsed(value)
+            return res
+        elif isinstance(o, list):
+            for (n, value) in enumerate(o):
+                o[n] = self._decode_parsed(value)
+            return o
+        elif isinstance(o, str):
+            cache = self._string_cache
+            if cache is None or len(o) > _MAX_CACHED_STRING_LENGTH:
+                return decode_value(o)
+
+            try:
+                return cache[o]
+            except KeyError:
+                pass
+
+            decoded = decode_value(o)
+            if len(cache) >= self._cache_size:
+                cache.clear()
+            cache[o] = decoded
+            return decoded
+        return o
+
+
+_default_decoder = NMOSJSONDecoder()
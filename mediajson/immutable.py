@@ -22,9 +22,11 @@ from json import JSONEncoder, JSONDecoder
 
 from .encode import dump, dumps, encode_value, NMOSJSONEncoder
 from .decode import load, loads, decode_value, NMOSJSONDecoder
+from .validate import validate, ValidationIssue
 
 
 __all__ = ["dump", "dumps", "load", "loads",
            "encode_value", "decode_value",
            "JSONEncoder", "JSONDecoder",
-           "NMOSJSONEncoder", "NMOSJSONDecoder"]
+           "NMOSJSONEncoder", "NMOSJSONDecoder",
+           "validate", "ValidationIssue"]
@@ -0,0 +1,426 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains a method to check that a document is valid json and
+that its timestamps, timeranges, uuids, and fractions are well-formed,
+without decoding it.
+
+To make use of it call validate on the document, optionally passing a schema
+which declares the types expected for particular fields.
+"""
+
+import sys
+import uuid
+import re
+from json import JSONDecoder, JSONDecodeError
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from json.scanner import NUMBER_RE
+from fractions import Fraction
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from mediatimestamp.immutable import Timestamp, TimeRange
+
+from .decode import (UUID_REGEX, TIMESTAMP_REGEX, TIMERANGE_REGEX, DEFAULT_CACHE_SIZE, _MAX_CACHED_STRING_LENGTH,
+                     _as_str, _is_fraction)
+
+
+__all__ = ["validate",
+           "ValidationIssue"]
+
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+WHITESPACE_STR = frozenset(' \t\n\r')
+
+_KIND_NAMES = {
+    uuid.UUID: "UUID",
+    Timestamp: "Timestamp",
+    TimeRange: "TimeRange",
+    Fraction: "Fraction",
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    type(None): "null",
+    dict: "object",
+    list: "array",
+}
+
+# The types which may appear in a schema, as well as dicts and single entry lists of schemas
+_SCHEMA_TYPES = frozenset([uuid.UUID, Timestamp, TimeRange, Fraction, str, int, float, bool])
+
+_CONSTANTS: Dict[str, Tuple[str, type]] = {
+    'n': ("null", type(None)),
+    't': ("true", bool),
+    'f': ("false", bool),
+    'N': ("NaN", float),
+    'I': ("Infinity", float),
+}
+
+# Used for the well-formedness check, since the C scanner is much faster than scanning in python
+_plain_decoder = JSONDecoder()
+
+# The kinds of recently seen short strings, so that repeated values do not need to be matched against the regexes again.
+# This holds at most DEFAULT_CACHE_SIZE entries.
+_string_kinds: Dict[str, type] = {}
+
+
+class ValidationIssue(NamedTuple):
+    """A problem found by validate.
+
+    path is the sequence of object keys and array indices leading to the offending value, and pos is its offset in the
+    document.
+    """
+    path: Tuple[Union[str, int], ...]
+    pos: int
+    msg: str
+
+
+def validate(s: Any, schema: Any = None) -> List[ValidationIssue]:
+    """Check that s is a valid json document which loads would decode without error, without decoding it.
+
+    s may be a str, bytes, bytearray or memoryview. The returned list is empty if the document is valid.
+
+    Fields are checked against the default decode_value rules, under which only fraction objects (ones with only a
+    "numerator" and optionally a "denominator" key) and a few strings ending in a newline can be malformed. A schema
+    can also be given to declare the types expected for particular fields: it is one of uuid.UUID, Timestamp,
+    TimeRange, Fraction, str, int, float (which also accepts integers) or bool, a dict mapping object keys to schemas,
+    or a list containing a single schema which applies to every entry of an array. Declared fields which are absent are
+    not reported. A TypeError is raised if the schema contains anything else.
+
+    The document is first parsed into plain json values by the standard library's decoder and checked without
+    constructing any timestamps, timeranges, uuids or fractions. Only when a problem is found is it scanned again to
+    locate each issue. Scanning stops at the first json syntax error, which is reported as the last issue in the list.
+    The kinds of short strings are cached between calls, in the same way as NMOSJSONDecoder caches decoded strings.
+    """
+    _check_schema(schema)
+    s = _as_str(s)
+    try:
+        if s.startswith('\ufeff'):
+            raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)", s, 0)
+        value = _plain_decoder.decode(s)
+    except RecursionError:
+        return [ValidationIssue((), 0, "Document is nested too deeply to decode")]
+    except ValueError:
+        # Includes JSONDecodeError, as well as integers with too many digits to convert
+        pass
+    else:
+        if _is_well_formed(value, schema):
+            return []
+    return _scan(s, schema)
+
+
+def _check_schema(schema: Any) -> None:
+    if isinstance(schema, dict):
+        for value in schema.values():
+            _check_schema(value)
+    elif isinstance(schema, list) and len(schema) == 1:
+        _check_schema(schema[0])
+    elif schema is not None and not (isinstance(schema, type) and schema in _SCHEMA_TYPES):
+        raise TypeError("Unsupported schema entry: {!r}".format(schema))
+
+
+def _kind_mismatch(schema: Any, kind: type) -> Optional[str]:
+    # Returns a message if a value which would be decoded to kind does not match schema
+    if schema is None:
+        return None
+    elif isinstance(schema, dict):
+        expected: type = dict
+    elif isinstance(schema, list):
+        expected = list
+    else:
+        expected = schema
+    if kind is expected or (expected is float and kind is int):
+        return None
+    return "Expecting {}, found {}".format(_KIND_NAMES[expected], _KIND_NAMES[kind])
+
+
+def _string_kind(o: str) -> type:
+    # Mirrors the string rules of decode_value
+    try:
+        return _string_kinds[o]
+    except KeyError:
+        pass
+
+    kind: type
+    if UUID_REGEX.match(o):
+        kind = uuid.UUID
+    elif TIMESTAMP_REGEX.match(o):
+        kind = Timestamp
+    elif TIMERANGE_REGEX.match(o) or o == "()":
+        kind = TimeRange
+    else:
+        kind = str
+
+    if len(o) <= _MAX_CACHED_STRING_LENGTH:
+        if len(_string_kinds) >= DEFAULT_CACHE_SIZE:
+            _string_kinds.clear()
+        _string_kinds[o] = kind
+    return kind
+
+
+def _string_failure(o: str, kind: type) -> Optional[str]:
+    # The regexes used by decode_value also match before a trailing newline, which uuid.UUID always rejects and
+    # TimeRange.from_str rejects when it directly follows an open end of the range
+    if o[-1:] != '\n':
+        return None
+    elif kind is uuid.UUID:
+        return "Malformed UUID"
+    elif kind is TimeRange and o.endswith('_\n'):
+        return "Malformed TimeRange"
+    return None
+
+
+def _fraction_failure(numerator: Any, denominator: Any) -> Optional[str]:
+    # As in python, booleans are accepted as integers
+    if not isinstance(numerator, int):
+        return "Fraction numerator must be an integer"
+    elif not isinstance(denominator, int):
+        return "Fraction denominator must be an integer"
+    elif denominator == 0:
+        return "Fraction denominator must not be zero"
+    return None
+
+
+def _is_well_formed(value: Any, schema: Any) -> bool:
+    # Walks the plain json values with explicit stacks, so that deeply nested documents are handled. Values with a
+    # declared schema are checked one by one, while containers without one only need the default rules applied.
+    declared = [(value, schema)]
+    undeclared: List[Any] = []
+    while declared:
+        (o, schema) = declared.pop()
+        if schema is None:
+            if isinstance(o, (dict, list)):
+                undeclared.append(o)
+            elif isinstance(o, str) and _string_failure(o, _string_kind(o)) is not None:
+                return False
+            continue
+
+        if isinstance(o, dict):
+            if _is_fraction(o):
+                if _fraction_failure(o['numerator'], o.get('denominator', 1)) is not None:
+                    return False
+                kind: type = Fraction
+            else:
+                kind = dict
+                if isinstance(schema, dict):
+                    for (key, entry) in o.items():
+                        field_schema = schema.get(key)
+                        if field_schema is not None:
+                            declared.append((entry, field_schema))
+                        elif type(entry) is dict or type(entry) is list:
+                            undeclared.append(entry)
+                        elif type(entry) is str and entry[-1:] == '\n':
+                            declared.append((entry, None))
+                else:
+                    undeclared.append(o)
+        elif isinstance(o, list):
+            kind = list
+            if isinstance(schema, list):
+                item_schema = schema[0]
+                for entry in o:
+                    # Arrays of strings of an already seen kind are common enough to be worth checking inline
+                    if type(entry) is not str or _string_kinds.get(entry) is not item_schema or entry[-1:] == '\n':
+                        declared.append((entry, item_schema))
+            else:
+                undeclared.append(o)
+        elif isinstance(o, str):
+            kind = _string_kind(o)
+            if _string_failure(o, kind) is not None:
+                return False
+        else:
+            kind = type(o)
+
+        if _kind_mismatch(schema, kind) is not None:
+            return False
+
+    while undeclared:
+        o = undeclared.pop()
+        if type(o) is dict:
+            if _is_fraction(o):
+                if _fraction_failure(o['numerator'], o.get('denominator', 1)) is not None:
+                    return False
+                continue
+            entries = o.values()
+        else:
+            entries = o
+        for entry in entries:
+            entry_type = type(entry)
+            if entry_type is dict or entry_type is list:
+                undeclared.append(entry)
+            elif entry_type is str and entry[-1:] == '\n' and _string_failure(entry, _string_kind(entry)) is not None:
+                return False
+    return True
+
+
+class _Container:
+    """An object or array which the scanner has started but not finished."""
+    def __init__(self, start: int, schema: Any):
+        self.start = start
+        self.schema = schema
+        self.fields = schema if isinstance(schema, dict) else None
+        self.items = schema[0] if isinstance(schema, list) else None
+        self.is_object = False
+        self.index = 0
+        # The kinds and offsets of the numerator and denominator, and whether any other key was seen, to spot fractions
+        self.numerator: Optional[Tuple[type, int, int]] = None
+        self.denominator: Optional[Tuple[type, int, int]] = None
+        self.other_keys = False
+
+
+def _scan(s: str, schema: Any) -> List[ValidationIssue]:
+    # Scans the document again, keeping track of positions and paths, to report each issue. This uses an explicit stack
+    # of the containers which have been started rather than recursion, so that deeply nested documents are handled.
+    issues: List[ValidationIssue] = []
+    path: List[Union[str, int]] = []
+    stack: List[_Container] = []
+    max_digits = getattr(sys, 'get_int_max_str_digits', lambda: 0)()
+
+    def issue(pos: int, msg: str) -> None:
+        issues.append(ValidationIssue(tuple(path), pos, msg))
+
+    def scan_key(idx: int, container: _Container) -> Tuple[int, Any]:
+        # Scans a key and its delimiter, returning the start and schema of its value
+        if s[idx:idx + 1] != '"':
+            raise JSONDecodeError("Expecting property name enclosed in double quotes", s, idx)
+        (key, idx) = scanstring(s, idx + 1)
+        idx = _skip_whitespace(s, idx)
+        if s[idx:idx + 1] != ':':
+            raise JSONDecodeError("Expecting ':' delimiter", s, idx)
+        path.append(key)
+        return (_skip_whitespace(s, idx + 1), container.fields.get(key) if container.fields is not None else None)
+
+    kind: type
+    try:
+        if s.startswith('\ufeff'):
+            raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)", s, 0)
+        idx = _skip_whitespace(s, 0)
+        while True:
+            # Scan the start of the value at idx, pushing a container if one is opened
+            start = idx
+            nextchar = s[idx:idx + 1]
+            if nextchar == '{' or nextchar == '[':
+                container = _Container(start, schema)
+                container.is_object = nextchar == '{'
+                idx = _skip_whitespace(s, idx + 1)
+                if s[idx:idx + 1] == ('}' if container.is_object else ']'):
+                    (idx, kind) = (idx + 1, dict if container.is_object else list)
+                else:
+                    stack.append(container)
+                    if container.is_object:
+                        (idx, schema) = scan_key(idx, container)
+                    else:
+                        path.append(0)
+                        schema = container.items
+                    continue
+            elif nextchar == '"':
+                (value, idx) = scanstring(s, idx + 1)
+                if schema is not None or value[-1:] == '\n':
+                    kind = _string_kind(value)
+                    failure = _string_failure(value, kind)
+                    if failure is not None:
+                        issue(start, failure)
+                else:
+                    kind = str
+            elif nextchar in _CONSTANTS and s.startswith(_CONSTANTS[nextchar][0], idx):
+                (literal, kind) = _CONSTANTS[nextchar]
+                idx += len(literal)
+            elif s.startswith('-Infinity', idx):
+                (idx, kind) = (idx + 9, float)
+            else:
+                m = NUMBER_RE.match(s, idx)
+                if m is None:
+                    raise JSONDecodeError("Expecting value", s, idx)
+                idx = m.end()
+                if m.group(2) is None and m.group(3) is None:
+                    kind = int
+                    digits = len(m.group(1).lstrip('-'))
+                    if max_digits > 0 and digits > max_digits:
+                        issue(start, "Exceeds the limit ({} digits) for integer string conversion: "
+                                     "value has {} digits".format(max_digits, digits))
+                else:
+                    kind = float
+
+            # Finish the value which started at start, and then any containers which it completes
+            while True:
+                mismatch = _kind_mismatch(schema, kind)
+                if mismatch is not None:
+                    issue(start, mismatch)
+                if not stack:
+                    break
+
+                container = stack[-1]
+                key = path.pop()
+                if container.is_object:
+                    if key == "numerator":
+                        container.numerator = (kind, start, idx)
+                    elif key == "denominator":
+                        container.denominator = (kind, start, idx)
+                    else:
+                        container.other_keys = True
+
+                idx = _skip_whitespace(s, idx)
+                nextchar = s[idx:idx + 1]
+                if nextchar == ',':
+                    break
+                elif nextchar != ('}' if container.is_object else ']'):
+                    raise JSONDecodeError("Expecting ',' delimiter", s, idx)
+
+                stack.pop()
+                (start, idx, schema) = (container.start, idx + 1, container.schema)
+                kind = _finish_object(s, container, issue) if container.is_object else list
+
+            if not stack:
+                break
+
+            # Move on to the next entry of the innermost container
+            container = stack[-1]
+            idx = _skip_whitespace(s, idx + 1)
+            if container.is_object:
+                (idx, schema) = scan_key(idx, container)
+            else:
+                container.index += 1
+                path.append(container.index)
+                schema = container.items
+
+        idx = _skip_whitespace(s, idx)
+        if idx != len(s):
+            raise JSONDecodeError("Extra data", s, idx)
+    except JSONDecodeError as e:
+        issues.append(ValidationIssue(tuple(path), e.pos, e.msg))
+    return issues
+
+
+def _finish_object(s: str, container: _Container, issue) -> type:
+    numerator = container.numerator
+    denominator = container.denominator
+    if numerator is None or container.other_keys:
+        return dict
+
+    if numerator[0] is not int and numerator[0] is not bool:
+        issue(numerator[1], "Fraction numerator must be an integer")
+    if denominator is not None:
+        if denominator[0] is not int and denominator[0] is not bool:
+            issue(denominator[1], "Fraction denominator must be an integer")
+        elif s[denominator[1]:denominator[2]].lstrip('-') in ('0', 'false'):
+            issue(denominator[1], "Fraction denominator must not be zero")
+    return Fraction
+
+
+def _skip_whitespace(s: str, idx: int) -> int:
+    if s[idx:idx + 1] not in WHITESPACE_STR:
+        return idx
+    m = WHITESPACE.match(s, idx)
+    return m.end() if m is not None else idx
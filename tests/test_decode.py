@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import unittest
+import tracemalloc
 from io import StringIO
 from uuid import UUID
 from mediatimestamp import Timestamp, TimeRange
@@ -94,3 +96,114 @@ class TestJSONDecode(unittest.TestCase):
         decoded = mediajson.loads(MEDIAJSON_STRING)
 
         self.assertEqual(MEDIAJSON_DATA, decoded)
+
+    def test_loads_bytes_like(self):
+        encoded = MEDIAJSON_STRING.encode('utf-8')
+
+        for s in [encoded, bytearray(encoded), memoryview(encoded)]:
+            with self.subTest(type=type(s)):
+                self.assertEqual(MEDIAJSON_DATA, mediajson.loads(s))
+
+    def test_loads_memoryview_slice(self):
+        buffer = bytearray(b'xxxx' + MEDIAJSON_STRING.encode('utf-16-le') + b'yyyy')
+        view = memoryview(buffer)[4:-4]
+
+        decoded = mediajson.loads(view)
+
+        self.assertEqual(MEDIAJSON_DATA, decoded)
+
+    def test_loads_non_contiguous_memoryview(self):
+        view = memoryview(b'[ 1 , 2 ]  ')[::2]
+
+        self.assertFalse(view.c_contiguous)
+        self.assertEqual([1, 2], mediajson.loads(view))
+        self.assertEqual([1, 2], mediajson.NMOSJSONDecoder().decode(view))
+
+    def test_loads_rejects_non_buffer(self):
+        with self.assertRaises(TypeError):
+            mediajson.loads(25)
+
+    def test_loads_rejects_bom(self):
+        with self.assertRaises(json.JSONDecodeError):
+            mediajson.loads('\ufeff' + PURE_JSON_STRING)
+
+    def test_decoder_decode_memoryview(self):
+        decoder = mediajson.NMOSJSONDecoder()
+
+        decoded = decoder.decode(memoryview(MEDIAJSON_STRING.encode('utf-8')))
+
+        self.assertEqual(MEDIAJSON_DATA, decoded)
+
+    def test_decoder_reuses_caches(self):
+        decoder = mediajson.NMOSJSONDecoder()
+
+        first = decoder.decode(MEDIAJSON_STRING)
+        second = decoder.decode(MEDIAJSON_STRING)
+
+        self.assertEqual(MEDIAJSON_DATA, first)
+        self.assertEqual(MEDIAJSON_DATA, second)
+        self.assertIs(first["uuid"], second["uuid"])
+        self.assertIs(first["timestamps"][0], second["timestamps"][0])
+        for (first_key, second_key) in zip(first.keys(), second.keys()):
+            self.assertIs(first_key, second_key)
+
+    def test_decoder_without_caches(self):
+        decoder = mediajson.NMOSJSONDecoder(cache_size=0)
+
+        first = decoder.decode(MEDIAJSON_STRING)
+        second = decoder.decode(MEDIAJSON_STRING)
+
+        self.assertEqual(MEDIAJSON_DATA, first)
+        self.assertEqual(MEDIAJSON_DATA, second)
+        self.assertIsNot(first["uuid"], second["uuid"])
+
+    def test_decoder_caches_are_bounded(self):
+        decoder = mediajson.NMOSJSONDecoder(cache_size=4)
+
+        for n in range(32):
+            self.assertEqual({"key{}".format(n): "value{}".format(n)},
+                             decoder.decode('{{"key{0}": "value{0}"}}'.format(n)))
+
+        self.assertLessEqual(len(decoder._string_cache), 4)
+        self.assertLessEqual(len(decoder._key_cache), 4)
+
+    def test_decoder_key_cache_is_bounded_within_object(self):
+        decoder = mediajson.NMOSJSONDecoder(cache_size=4)
+        data = {"key{}".format(n): n for n in range(1000)}
+        data["x" * 1000] = 0
+
+        self.assertEqual(data, decoder.decode(json.dumps(data)))
+        self.assertLessEqual(len(decoder._key_cache), 4)
+        self.assertNotIn("x" * 1000, decoder._key_cache)
+
+    def test_decoder_does_not_modify_hook_results(self):
+        shared = ["417798915:0"]
+        decoder = mediajson.NMOSJSONDecoder(object_hook=lambda o: shared)
+
+        decoded = decoder.decode('{"a": 1}')
+
+        self.assertEqual([Timestamp.from_sec_nsec("417798915:0")], decoded)
+        self.assertEqual(["417798915:0"], shared)
+
+    def _measure_peak(self, decode, messages):
+        # Warm up first, so that only the steady state cost of decoding each message is measured
+        decode(messages[0])
+        tracemalloc.start()
+        try:
+            for message in messages:
+                decode(message)
+            (current, peak) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    def test_caches_reduce_steady_state_allocations(self):
+        messages = [memoryview(MEDIAJSON_STRING.encode('utf-8')) for _ in range(200)]
+
+        copied = self._measure_peak(lambda m: mediajson.decode_value(json.loads(bytes(m))), messages)
+        uncached = self._measure_peak(mediajson.NMOSJSONDecoder(cache_size=0).decode, messages)
+        cached = self._measure_peak(mediajson.NMOSJSONDecoder().decode, messages)
+
+        # Reusing the caches avoids rebuilding the media objects and keys of each message
+        self.assertLess(cached, copied * 3 / 4)
+        self.assertLess(cached, uncached * 3 / 4)
@@ -0,0 +1,209 @@
+# Copyright 2019 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sys
+import timeit
+import unittest
+from unittest import mock
+from uuid import UUID, uuid4
+from mediatimestamp import Timestamp, TimeRange
+from fractions import Fraction
+
+import mediajson
+from mediajson import ValidationIssue
+
+from .test_decode import PURE_JSON_STRING, MEDIAJSON_STRING
+
+
+MEDIAJSON_SCHEMA = {
+    "uuid": UUID,
+    "rationals": [Fraction],
+    "timestamps": [Timestamp],
+    "timeranges": [TimeRange],
+}
+
+
+class TestJSONValidate(unittest.TestCase):
+    def test_validate_pure_json(self):
+        self.assertEqual([], mediajson.validate(PURE_JSON_STRING))
+
+    def test_validate_mediajson(self):
+        self.assertEqual([], mediajson.validate(MEDIAJSON_STRING))
+        self.assertEqual([], mediajson.validate(MEDIAJSON_STRING, MEDIAJSON_SCHEMA))
+
+    def test_validate_bytes_like(self):
+        encoded = MEDIAJSON_STRING.encode('utf-8')
+
+        for s in [encoded, bytearray(encoded), memoryview(encoded)]:
+            with self.subTest(type=type(s)):
+                self.assertEqual([], mediajson.validate(s, MEDIAJSON_SCHEMA))
+
+    def test_validate_matches_json_syntax(self):
+        for s in ['', '{', '{"a": 1,}', '{"a" 1}', '[1 2]', '[1,]', '"\\x"', '{1: 2}', '{} []', 'nul',
+                  '-', '01', '"\\u12"', '[1]\n', ' -Infinity ', '{"a": [NaN, Infinity, true, false, null, -1.5e3]}']:
+            with self.subTest(s=s):
+                try:
+                    json.loads(s)
+                except json.JSONDecodeError as e:
+                    issues = mediajson.validate(s)
+                    self.assertEqual(1, len(issues))
+                    self.assertEqual(e.pos, issues[-1].pos)
+                else:
+                    self.assertEqual([], mediajson.validate(s))
+
+    def test_validate_bad_fractions(self):
+        s = '{"a": {"numerator": 1.5, "denominator": 2}, "b": [{"numerator": 1, "denominator": 0}],' \
+            ' "c": {"numerator": "1"}, "d": {"numerator": 1, "denominator": 2, "other": 3}}'
+
+        issues = mediajson.validate(s)
+
+        self.assertEqual([
+            ValidationIssue(("a",), s.index('1.5'), "Fraction numerator must be an integer"),
+            ValidationIssue(("b", 0), s.index('0}'), "Fraction denominator must not be zero"),
+            ValidationIssue(("c",), s.index('"1"'), "Fraction numerator must be an integer"),
+        ], issues)
+        with self.assertRaises(TypeError):
+            mediajson.loads(s)
+
+    def test_validate_boolean_fractions(self):
+        s = '[{"numerator": true}, {"numerator": 1, "denominator": true}, {"numerator": 1, "denominator": false}]'
+
+        issues = mediajson.validate(s)
+
+        self.assertEqual([ValidationIssue((2,), s.index('false'), "Fraction denominator must not be zero")], issues)
+        self.assertEqual([Fraction(1, 1), Fraction(1, 1)], mediajson.loads(s[:s.rindex(', {')] + ']'))
+
+    def test_validate_trailing_newline_strings(self):
+        s = '["b8b4a34f-3293-11e8-89c0-acde48001122\\n", "417798915:0\\n", "_\\n", "[417798915:0_417798916:0]\\n"]'
+
+        issues = mediajson.validate(s)
+
+        self.assertEqual([
+            ValidationIssue((0,), s.index('"b8b4'), "Malformed UUID"),
+            ValidationIssue((2,), s.index('"_'), "Malformed TimeRange"),
+        ], issues)
+        for (n, entry) in enumerate(json.loads(s)):
+            with self.subTest(entry=entry):
+                if n in (0, 2):
+                    self.assertRaises(ValueError, mediajson.loads, json.dumps(entry))
+                else:
+                    mediajson.loads(json.dumps(entry))
+
+    def test_validate_integer_digit_limit(self):
+        s = '[1, {}]'.format('1' * 5000)
+
+        issues = mediajson.validate(s)
+
+        self.assertEqual(1, len(issues))
+        self.assertEqual(((1,), 4), issues[0][:2])
+        self.assertRaises(ValueError, mediajson.loads, s)
+
+    def test_validate_deeply_nested(self):
+        s = '[' * 600 + '{"numerator": 1, "denominator": 0}' + ']' * 600
+
+        issues = mediajson.validate(s)
+
+        self.assertEqual([ValidationIssue((0,) * 600, s.index('0}'), "Fraction denominator must not be zero")], issues)
+        self.assertEqual([], mediajson.validate('[' * 600 + ']' * 600))
+        self.assertEqual([ValidationIssue((0, 0, 0), 3, "Expecting Timestamp, found array")],
+                         mediajson.validate('[' * 600 + ']' * 600, [[[Timestamp]]]))
+        self.assertEqual(1, len(mediajson.validate('[' * 100000 + ']' * 100000)))
+
+    def test_validate_float_accepts_integer(self):
+        self.assertEqual([], mediajson.validate('1', float))
+        self.assertEqual([], mediajson.validate('1.5', float))
+        self.assertEqual([ValidationIssue((), 0, "Expecting integer, found number")], mediajson.validate('1.5', int))
+
+    def test_validate_rejects_unsupported_schema(self):
+        for schema in ["UUID", {"id": "UUID"}, {"ids": [UUID, Timestamp]}, [], {"a": {"b": object}}]:
+            with self.subTest(schema=schema):
+                with self.assertRaises(TypeError):
+                    mediajson.validate('{}', schema)
+
+    def test_validate_schema_mismatches(self):
+        s = '{"uuid": "417798915:0", "rationals": [{"numerator": 25}, "bar"], "timestamps": "417798915:0",' \
+            ' "timeranges": ["_", "b8b4a34f-3293-11e8-89c0-acde48001122"], "extra": "417798915:0"}'
+
+        issues = mediajson.validate(s, MEDIAJSON_SCHEMA)
+
+        self.assertEqual([
+            ValidationIssue(("uuid",), s.index('"417798915:0"'), "Expecting UUID, found Timestamp"),
+            ValidationIssue(("rationals", 1), s.index('"bar"'), "Expecting Fraction, found string"),
+            ValidationIssue(("timestamps",), s.index('"417798915:0", "timeranges"'),
+                            "Expecting array, found Timestamp"),
+            ValidationIssue(("timeranges", 1), s.index('"b8b4'), "Expecting TimeRange, found UUID"),
+        ], issues)
+
+    def test_validate_nested_schema(self):
+        s = '{"flows": [{"id": "not-a-uuid", "rate": {"numerator": 50}},' \
+            ' {"id": "b8b4a34f-3293-11e8-89c0-acde48001122"}]}'
+
+        issues = mediajson.validate(s, {"flows": [{"id": UUID, "rate": Fraction}]})
+
+        self.assertEqual([ValidationIssue(("flows", 0, "id"), s.index('"not-a-uuid"'), "Expecting UUID, found string")],
+                         issues)
+
+    def test_validate_reports_media_issues_before_syntax_error(self):
+        s = '{"a": {"numerator": 1, "denominator": 0}, "b": [1, 2'
+
+        issues = mediajson.validate(s)
+
+        self.assertEqual(2, len(issues))
+        self.assertEqual(("a",), issues[0].path)
+        self.assertEqual(("b",), issues[1].path)
+        self.assertEqual(len(s), issues[1].pos)
+
+    def test_validate_containers_against_scalar_values(self):
+        s = '{"a": "x", "b": "y"}'
+
+        issues = mediajson.validate(s, {"a": [str], "b": {"c": str}})
+
+        self.assertEqual([
+            ValidationIssue(("a",), s.index('"x"'), "Expecting array, found string"),
+            ValidationIssue(("b",), s.index('"y"'), "Expecting object, found string"),
+        ], issues)
+
+    def test_validate_string_kind_cache_is_bounded(self):
+        s = json.dumps([str(n) + ":0" for n in range(mediajson.decode.DEFAULT_CACHE_SIZE * 2)] + ["x" * 1000])
+
+        last = mediajson.decode.DEFAULT_CACHE_SIZE * 2
+        self.assertEqual([ValidationIssue((last,), s.index('"xx'), "Expecting Timestamp, found string")],
+                         mediajson.validate(s, [Timestamp]))
+        # The validate function shadows its module as an attribute of the package
+        string_kinds = sys.modules["mediajson.validate"]._string_kinds
+        self.assertLessEqual(len(string_kinds), mediajson.decode.DEFAULT_CACHE_SIZE)
+        self.assertNotIn("x" * 1000, string_kinds)
+
+    def test_validate_is_faster_than_loads(self):
+        s = json.dumps([{"id": str(uuid4()), "ts": "{}:{}".format(n, n), "range": "[{}:0_{}:0)".format(n, n + 1),
+                         "rate": {"numerator": n, "denominator": 1001}, "label": "flow {}".format(n)}
+                        for n in range(2000)])
+        schema = [{"id": UUID, "ts": Timestamp, "range": TimeRange, "rate": Fraction}]
+
+        self.assertEqual([], mediajson.validate(s, schema))
+        validate_time = min(timeit.repeat(lambda: mediajson.validate(s, schema), number=1, repeat=3))
+        loads_time = min(timeit.repeat(lambda: mediajson.loads(s), number=1, repeat=3))
+
+        self.assertLess(validate_time, loads_time)
+
+    def test_validate_does_not_construct_media_objects(self):
+        with mock.patch.object(Timestamp, "from_sec_nsec") as from_sec_nsec, \
+                mock.patch.object(TimeRange, "from_str") as from_str, \
+                mock.patch.object(TimeRange, "never") as never:
+            self.assertEqual([], mediajson.validate(MEDIAJSON_STRING, MEDIAJSON_SCHEMA))
+
+        from_sec_nsec.assert_not_called()
+        from_str.assert_not_called()
+        never.assert_not_called()